@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import random
+
+from .client import NetClient
+from .protocol import (
+    BUTTON_UP, BUTTON_DOWN, BUTTON_LEFT, BUTTON_RIGHT, BUTTON_FIRE, encode_snapshot,
+)
+from .server import GameServer, ServerWorld
+from .settings import MAP_WIDTH, MAP_HEIGHT, SERVER_HOST, SERVER_TICK_RATE
+
+MOVE_BUTTONS = (0, BUTTON_UP, BUTTON_DOWN, BUTTON_LEFT, BUTTON_RIGHT, BUTTON_UP | BUTTON_LEFT)
+
+
+async def run_benchmark(clients, seconds, zombies, tick_rate=SERVER_TICK_RATE, seed=0):
+    """Drive simulated clients against a local server and return measurements."""
+    rng = random.Random(seed)
+    world = ServerWorld(max_zombies=zombies, rng=random.Random(seed))
+    for _ in range(zombies):
+        world.spawn_zombie()
+    server = GameServer(SERVER_HOST, 0, tick_rate, world)
+    await server.start()
+
+    net_clients = [NetClient() for _ in range(clients)]
+    for client in net_clients:
+        await client.connect(SERVER_HOST, server.port)
+    buttons = [0] * clients
+
+    start_tick = server.tick_count
+    start_seconds = server.tick_seconds
+    start_bytes = sum(c.bytes_sent for c in server.clients.values())
+    start_snapshots = sum(c.snapshots_sent for c in server.clients.values())
+    loop = asyncio.get_running_loop()
+    end = loop.time() + seconds
+    while loop.time() < end:
+        for index, client in enumerate(net_clients):
+            if rng.random() < 0.05:
+                buttons[index] = rng.choice(MOVE_BUTTONS) | BUTTON_FIRE
+            aim = (rng.uniform(0, MAP_WIDTH), rng.uniform(0, MAP_HEIGHT))
+            client.send_input(buttons[index], aim)
+        await asyncio.sleep(1.0 / tick_rate)
+
+    ticks = server.tick_count - start_tick
+    tick_seconds = server.tick_seconds - start_seconds
+    sent = sum(c.bytes_sent for c in server.clients.values()) - start_bytes
+    snapshots = sum(c.snapshots_sent for c in server.clients.values()) - start_snapshots
+    full_size = len(encode_snapshot(server.tick_count, server.world.snapshot()))
+
+    for client in net_clients:
+        await client.close()
+    await server.stop()
+
+    ticks = max(1, ticks)
+    snapshots = max(1, snapshots)
+    return {
+        "clients": clients,
+        "ticks": ticks,
+        "tick_ms": tick_seconds / ticks * 1000,
+        "tick_ms_per_client": tick_seconds / ticks * 1000 / max(1, clients),
+        "snapshot_bytes": sent / snapshots,
+        "full_snapshot_bytes": full_size,
+        "client_kbps": sent / snapshots * tick_rate * 8 / 1000,
+    }
+
+
+def main():
+    """Entry point: python -m isogame.bench_server --clients 8."""
+    parser = argparse.ArgumentParser(description="Benchmark the local multiplayer server.")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--zombies", type=int, default=200)
+    args = parser.parse_args()
+
+    print("clients  tick ms  ms/client  delta B  full B  kbit/s/client")
+    for clients in args.clients:
+        result = asyncio.run(run_benchmark(clients, args.seconds, args.zombies))
+        print(
+            f"{result['clients']:7d}  {result['tick_ms']:7.3f}  {result['tick_ms_per_client']:9.3f}"
+            f"  {result['snapshot_bytes']:7.0f}  {result['full_snapshot_bytes']:6d}"
+            f"  {result['client_kbps']:13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
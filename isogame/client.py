@@ -0,0 +1,82 @@
+import asyncio
+
+from .protocol import (
+    empty_state, dequantize, decode_welcome, encode_input, decode_snapshot,
+    read_message, write_message,
+)
+from .settings import SERVER_HOST, SERVER_PORT, SNAPSHOT_HISTORY
+
+
+class NetClient:
+    """Connection to a GameServer that sends input and tracks snapshots.
+
+    Attributes:
+        player_id (int | None): Id assigned by the server.
+        tick (int): Tick of the newest decoded snapshot.
+        state (dict): Kind -> {entity id -> quantized fields} at that tick.
+        bytes_received (int): Snapshot payload bytes received so far.
+    """
+
+    def __init__(self):
+        """Create a disconnected client."""
+        self.player_id = None
+        self.tick = 0
+        self.state = empty_state()
+        self.bytes_received = 0
+        self._baselines = {}
+        self._seq = 0
+        self._reader = None
+        self._writer = None
+        self._receive_task = None
+
+    async def connect(self, host=SERVER_HOST, port=SERVER_PORT):
+        """Connect, wait for the welcome message and start receiving snapshots."""
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+        self.player_id = decode_welcome(await read_message(self._reader))
+        self._receive_task = asyncio.create_task(self._receive())
+
+    def send_input(self, buttons, aim):
+        """Send held buttons and aim point, acknowledging the newest snapshot."""
+        self._seq += 1
+        write_message(self._writer, encode_input(self._seq, self.tick, buttons, aim))
+
+    def positions(self, kind):
+        """Return (id, x, y) world positions of every entity of a kind."""
+        return [
+            (entity_id, dequantize(fields[0]), dequantize(fields[1]))
+            for entity_id, fields in self.state[kind].items()
+        ]
+
+    async def close(self):
+        """Stop receiving and close the connection."""
+        if self._receive_task is not None:
+            self._receive_task.cancel()
+            try:
+                await self._receive_task
+            except asyncio.CancelledError:
+                pass
+        if self._writer is not None:
+            self._writer.close()
+
+    async def _receive(self):
+        try:
+            while True:
+                data = await read_message(self._reader)
+                self.bytes_received += len(data)
+                tick, state = decode_snapshot(data, self._baselines)
+                self._store_baseline(tick, state)
+                self.tick = tick
+                self.state = state
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    def _store_baseline(self, tick, state):
+        """Keep a decoded state for future deltas, dropping ones the server forgot.
+
+        Ticks can arrive with gaps when the server skips a slow client, so
+        every baseline at or before tick - SNAPSHOT_HISTORY is removed.
+        """
+        self._baselines[tick] = state
+        oldest = tick - SNAPSHOT_HISTORY
+        for old_tick in [t for t in self._baselines if t <= oldest]:
+            del self._baselines[old_tick]
@@ -1,3 +1,4 @@
+import math
 import pygame
 from .settings import (
     PLAYER_SPEED, PLAYER_COLOR, GUN_COLOR,
@@ -9,10 +10,45 @@ from .settings import (
     POWERUP_RADIUS, POWERUP_HEAL_COLOR, POWERUP_SPEED_COLOR,
 )
 
+PLAYER_HEAD_COLOR = (232, 190, 172)
+ZOMBIE_HEAD_COLOR = (78, 110, 86)
+
+
+def _humanoid_anchor(zoom, height):
+    """Offset of the ground point inside a humanoid sprite."""
+    return pygame.Vector2(12 * zoom, (height + 24) * zoom)
+
+
+def _humanoid_sprite(zoom, body_color, head_color, height):
+    """Render shadow, body and head of a humanoid at the given zoom."""
+    anchor = _humanoid_anchor(zoom, height)
+    size = (math.ceil(24 * zoom) + 1, math.ceil((height + 28) * zoom) + 1)
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    shadow_rect = pygame.Rect(0, anchor.y - 4 * zoom, 24 * zoom, 8 * zoom)
+    pygame.draw.ellipse(sprite, SHADOW_COLOR, shadow_rect)
+
+    body_pos = anchor - pygame.Vector2(0, height * zoom)
+    body_rect = pygame.Rect(0, 0, 20 * zoom, 28 * zoom)
+    body_rect.center = (body_pos.x, body_pos.y + 4 * zoom)
+    pygame.draw.ellipse(sprite, body_color, body_rect)
+
+    head_pos = pygame.Vector2(body_pos.x, body_pos.y - 18 * zoom)
+    pygame.draw.circle(sprite, head_color, head_pos, max(1, round(6 * zoom)))
+    return sprite
+
+
+def _disc_sprite(zoom, color, radius):
+    """Render a filled circle centered in its sprite."""
+    scaled = max(1, round(radius * zoom))
+    sprite = pygame.Surface((scaled * 2 + 1, scaled * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (scaled, scaled), scaled)
+    return sprite
+
+
 class Player:
     """Player controlled with WASD and mouse aim."""
 
-    def __init__(self, pos):
+    def __init__(self, pos, scheduler):
         """Choose player positions speed and aim direction."""
         self.pos = pygame.Vector2(pos)
         self.radius = 10
@@ -20,7 +56,8 @@ class Player:
         self.aim_dir = pygame.Vector2(1, 0)
         self.max_hp = PLAYER_MAX_HP
         self.hp = PLAYER_MAX_HP
-        self.hit_timer = 0.0
+        self.scheduler = scheduler
+        self.hit_timer = None
 
     def update(self, keys, dt, bounds, speed_multiplier=1.0):
         """Move with WASD while staying inside map bounds."""
@@ -35,8 +72,6 @@ class Player:
             direction += pygame.Vector2(1, -1)
         if direction.length_squared() > 0:
             direction = direction.normalize()
-        if self.hit_timer > 0:
-            self.hit_timer = max(0.0, self.hit_timer - dt)
         self.pos += direction * self.speed * speed_multiplier * dt
         self.pos.x = max(0.0, min(bounds[0] - 1, self.pos.x))
         self.pos.y = max(0.0, min(bounds[1] - 1, self.pos.y))
@@ -49,26 +84,29 @@ class Player:
 
     def take_damage(self, amount):
         """Reduce HP if not on cooldown."""
-        if self.hit_timer > 0:
+        if self.hit_timer is not None:
             return False
         self.hp = max(0, self.hp - amount)
-        self.hit_timer = PLAYER_HIT_COOLDOWN
+        self.make_invulnerable(PLAYER_HIT_COOLDOWN)
         return True
 
+    def make_invulnerable(self, duration):
+        """Ignore damage for duration seconds."""
+        if self.hit_timer is not None:
+            self.hit_timer.cancel()
+        self.hit_timer = self.scheduler.schedule(duration, self._end_invulnerability)
+
+    def _end_invulnerability(self):
+        self.hit_timer = None
+
     def draw(self, surface, iso_map):
         """Draw the player with a shadow and height offset."""
         screen_pos = iso_map.world_to_screen(self.pos)
-        shadow_rect = pygame.Rect(screen_pos.x - 12, screen_pos.y - 4, 24, 8)
-        pygame.draw.ellipse(surface, SHADOW_COLOR, shadow_rect)
-
-        body_pos = screen_pos - pygame.Vector2(0, PLAYER_HEIGHT)
-        body_rect = pygame.Rect(0, 0, 20, 28)
-        body_rect.center = (body_pos.x, body_pos.y + 4)
-        pygame.draw.ellipse(surface, PLAYER_COLOR, body_rect)
-
-        head_pos = pygame.Vector2(body_pos.x, body_pos.y - 18)
-        head_color = (232, 190, 172)
-        pygame.draw.circle(surface, head_color, head_pos, 6)
+        sprite = iso_map.sprite(
+            ("player",),
+            lambda zoom: _humanoid_sprite(zoom, PLAYER_COLOR, PLAYER_HEAD_COLOR, PLAYER_HEIGHT),
+        )
+        surface.blit(sprite, screen_pos - _humanoid_anchor(iso_map.zoom, PLAYER_HEIGHT))
 
 class Zombie:
     """Simple Zombie NPC that follows the player"""
@@ -93,24 +131,23 @@ class Zombie:
     def draw(self, surface, iso_map):
         """Draw the zombie with a shadow and height offset."""
         screen_pos = iso_map.world_to_screen(self.pos)
-        shadow_rect = pygame.Rect(screen_pos.x - 12, screen_pos.y - 4, 24, 8)
-        pygame.draw.ellipse(surface, SHADOW_COLOR, shadow_rect)
-
-        body_pos = screen_pos - pygame.Vector2(0, ZOMBIE_HEIGHT)
-        body_rect = pygame.Rect(0, 0, 20, 28)
-        body_rect.center = (body_pos.x, body_pos.y + 4)
-        pygame.draw.ellipse(surface, ZOMBIE_COLOR, body_rect)
-
-        head_pos = pygame.Vector2(body_pos.x, body_pos.y - 18)
-        head_color = (78, 110, 86)
-        pygame.draw.circle(surface, head_color, head_pos, 6)
+        sprite = iso_map.sprite(
+            ("zombie",),
+            lambda zoom: _humanoid_sprite(zoom, ZOMBIE_COLOR, ZOMBIE_HEAD_COLOR, ZOMBIE_HEIGHT),
+        )
+        surface.blit(sprite, screen_pos - _humanoid_anchor(iso_map.zoom, ZOMBIE_HEIGHT))
 
 class Bullet:
     """Projectile fired from the player."""
 
-    def __init__(self, pos, direction, speed=BULLET_SPEED):
-        """Create a bullet with position, direction, and lifetime."""
+    def __init__(self, pos, direction, speed=BULLET_SPEED, owner=None):
+        """Create a bullet with position, direction, and lifetime.
+
+        Args:
+            owner: The Pilot credited with kills, if any.
+        """
         self.pos = pygame.Vector2(pos)
+        self.owner = owner
         self.velocity = pygame.Vector2(direction) * speed
         self.radius = 4
         self.remaining = BULLET_LIFETIME
@@ -128,7 +165,11 @@ class Bullet:
     def draw(self, surface, iso_map):
         """Draw the bullet at its position"""
         screen_pos = iso_map.world_to_screen(self.pos)
-        pygame.draw.circle(surface, BULLET_COLOR, screen_pos, self.radius)
+        sprite = iso_map.sprite(
+            ("bullet", self.radius),
+            lambda zoom: _disc_sprite(zoom, BULLET_COLOR, self.radius),
+        )
+        surface.blit(sprite, sprite.get_rect(center=screen_pos))
 
 class PowerUp:
     """Pickup item on the map."""
@@ -143,4 +184,8 @@ class PowerUp:
         """Draw the powerup."""
         screen_pos = iso_map.world_to_screen(self.pos)
         color = POWERUP_HEAL_COLOR if self.kind == "heal" else POWERUP_SPEED_COLOR
-        pygame.draw.circle(surface, color, screen_pos, self.radius)
+        sprite = iso_map.sprite(
+            ("powerup", self.kind, self.radius),
+            lambda zoom: _disc_sprite(zoom, color, self.radius),
+        )
+        surface.blit(sprite, sprite.get_rect(center=screen_pos))
@@ -1,62 +1,178 @@
+import math
 import random
 import pygame
+from .render_cache import SurfaceCache
 from .settings import (
     GRID_COLOR, TILE_COLOR_1, TILE_COLOR_2, GRASS_DETAIL_COLOR,
     DECORATION_SEED, TREE_CHANCE, ROCK_CHANCE, FLOWER_CHANCE,
     TREE_COLOR, TREE_TRUNK_COLOR, ROCK_COLOR, FLOWER_COLOR,
+    DEFAULT_ZOOM, MAP_CHUNK_SIZE, RENDER_CACHE_BYTES,
 )
 
+GROUND_PAD = 2
+DECORATION_PAD = 36
+
+
+def _decoration_anchor(zoom):
+    """Offset from a decoration sprite's top-left corner to its ground point."""
+    return pygame.Vector2(math.ceil(12 * zoom) + 1, math.ceil(32 * zoom) + 1)
+
+
+def _decoration_sprite(zoom, kind):
+    """Render a single tree, rock or flower scaled to a zoom level."""
+    base = _decoration_anchor(zoom)
+    z = zoom
+    sprite = pygame.Surface((2 * base.x, base.y + math.ceil(6 * z) + 1), pygame.SRCALPHA)
+    if kind == "tree":
+        trunk_rect = pygame.Rect(base.x - 3 * z, base.y - 14 * z, 6 * z, 12 * z)
+        pygame.draw.rect(sprite, TREE_TRUNK_COLOR, trunk_rect)
+        pygame.draw.circle(
+            sprite, TREE_COLOR, (int(base.x), int(base.y - 20 * z)), max(1, round(12 * z))
+        )
+    elif kind == "rock":
+        rock_rect = pygame.Rect(base.x - 8 * z, base.y - 6 * z, 16 * z, 12 * z)
+        pygame.draw.ellipse(sprite, ROCK_COLOR, rock_rect)
+    else:
+        pygame.draw.circle(
+            sprite, FLOWER_COLOR, (int(base.x), int(base.y - 8 * z)), max(1, round(5 * z))
+        )
+    return sprite
+
 
 class IsoMap:
-    """Isometric grid for rendering and coordinate transforms 
-    
+    """Isometric grid for rendering and coordinate transforms
+
     Args:
         width (int): Number of tiles along the x-axis.
         height (int): Number of tiles along the y-axis.
         tile_width (int): Pixel width of a diamond tile.
         tile_height (int): Pixel height of a diamond tile.
         origin (tuple[float, float]) Screen-space offset of the map center
+        zoom (float): Scale factor applied to the projection.
 
     Attributes:
         width (int): Grid width in tiles
         height (int): Grid height in tiles.
-        tile_width (int): Tile width in pixels.
-        tile_height (int): Tile height in pixels.
+        tile_width (int): Tile width in pixels at zoom 1.
+        tile_height (int): Tile height in pixels at zoom 1.
         origin (pygame.Vector2): Screen offset for the amp.
+        zoom (float): Current zoom level.
+        cache (SurfaceCache): Pre-rendered ground chunks and sprites per zoom;
+            decorations are one sprite per kind, blitted where visible.
     """
 
-    def __init__(self, width, height, tile_width, tile_height, origin):
+    def __init__(self, width, height, tile_width, tile_height, origin, zoom=DEFAULT_ZOOM):
         """Store map size, tile size, and screen origin."""
         self.width = width
         self.height = height
         self.tile_width = tile_width
         self.tile_height = tile_height
         self.origin = pygame.Vector2(origin)
+        self.zoom = zoom
+        self.cache = SurfaceCache(RENDER_CACHE_BYTES)
         self.decorations = self._generate_decorations()
+        self._chunk_decorations = self._group_decorations()
+
+    def set_zoom(self, zoom):
+        """Switch zoom level; surfaces for other levels stay cached."""
+        self.zoom = zoom
 
     def world_to_screen(self, world_pos):
         """Convert world grid to screen pixel coords."""
         world_pos = pygame.Vector2(world_pos)
-        screen_x = (world_pos.x - world_pos.y) * (self.tile_width / 2)
-        screen_y = (world_pos.x + world_pos.y) * (self.tile_height / 2)
+        screen_x = (world_pos.x - world_pos.y) * (self.tile_width * self.zoom / 2)
+        screen_y = (world_pos.x + world_pos.y) * (self.tile_height * self.zoom / 2)
         return pygame.Vector2(screen_x, screen_y) + self.origin
 
     def screen_to_world(self, screen_pos):
         """Convert screen pixel coords back to world grid."""
         screen_pos = pygame.Vector2(screen_pos) - self.origin
-        scaled_x = screen_pos.x / (self.tile_width / 2)
-        scaled_y = screen_pos.y / (self.tile_height / 2)
+        scaled_x = screen_pos.x / (self.tile_width * self.zoom / 2)
+        scaled_y = screen_pos.y / (self.tile_height * self.zoom / 2)
         world_x = (scaled_x + scaled_y) / 2
         world_y = (scaled_y - scaled_x) / 2
         return pygame.Vector2(world_x, world_y)
 
+    def world_to_iso(self, world_pos):
+        """Project world coords at zoom 1 without the origin.
+
+        Used for gameplay distances so collisions do not depend on the camera.
+        """
+        world_pos = pygame.Vector2(world_pos)
+        return pygame.Vector2(
+            (world_pos.x - world_pos.y) * (self.tile_width / 2),
+            (world_pos.x + world_pos.y) * (self.tile_height / 2),
+        )
+
+    def sprite(self, key, build):
+        """Return a cached sprite for the current zoom, building it on a miss."""
+        zoom = self.zoom
+        return self.cache.get(("sprite", key, zoom), lambda: build(zoom))
+
     def draw(self, surface):
-        """Render the iso tile grid to the given surface"""
-        half_w = self.tile_width / 2
-        half_h = self.tile_height / 2
-        for y in range(self.height):
-            for x in range(self.width):
-                center = self.world_to_screen((x,y))
+        """Render the visible ground chunks, then the decorations on them."""
+        view = surface.get_rect()
+        chunks_x = math.ceil(self.width / MAP_CHUNK_SIZE)
+        chunks_y = math.ceil(self.height / MAP_CHUNK_SIZE)
+        zoom = self.zoom
+        for cy in range(chunks_y):
+            for cx in range(chunks_x):
+                rect = self._chunk_rect(cx, cy, GROUND_PAD)
+                rect.move_ip(self.origin.x, self.origin.y)
+                if not rect.colliderect(view):
+                    continue
+                chunk = self.cache.get(
+                    ("ground", cx, cy, zoom), lambda: self._render_ground_chunk(cx, cy)
+                )
+                surface.blit(chunk, rect.topleft)
+
+        anchor = _decoration_anchor(zoom)
+        for cy in range(chunks_y):
+            for cx in range(chunks_x):
+                decorations = self._chunk_decorations.get((cx, cy))
+                if not decorations:
+                    continue
+                rect = self._chunk_rect(cx, cy, DECORATION_PAD)
+                rect.move_ip(self.origin.x, self.origin.y)
+                if not rect.colliderect(view):
+                    continue
+                for kind, pos in decorations:
+                    sprite = self.sprite(
+                        ("decoration", kind), lambda zoom: _decoration_sprite(zoom, kind)
+                    )
+                    surface.blit(sprite, self.world_to_screen(pos) - anchor)
+
+    def _chunk_rect(self, cx, cy, pad):
+        """Bounding rect of a chunk in origin-free screen space."""
+        half_w = self.tile_width * self.zoom / 2
+        half_h = self.tile_height * self.zoom / 2
+        x0 = cx * MAP_CHUNK_SIZE
+        y0 = cy * MAP_CHUNK_SIZE
+        nx = min(MAP_CHUNK_SIZE, self.width - x0)
+        ny = min(MAP_CHUNK_SIZE, self.height - y0)
+        pad = math.ceil(pad * self.zoom) + 1
+        left = math.floor((x0 - y0 - ny) * half_w) - pad
+        right = math.ceil((x0 - y0 + nx) * half_w) + pad
+        top = math.floor((x0 + y0 - 1) * half_h) - pad
+        bottom = math.ceil((x0 + y0 + nx + ny - 1) * half_h) + pad
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def _render_ground_chunk(self, cx, cy):
+        """Draw the tiles of one chunk at the current zoom into their own surface."""
+        rect = self._chunk_rect(cx, cy, GROUND_PAD)
+        chunk = pygame.Surface(rect.size, pygame.SRCALPHA)
+        self._draw_tiles(chunk, cx, cy, pygame.Vector2(-rect.x, -rect.y))
+        return chunk
+
+    def _draw_tiles(self, surface, cx, cy, offset):
+        """Render the diamond tiles of one chunk."""
+        half_w = self.tile_width * self.zoom / 2
+        half_h = self.tile_height * self.zoom / 2
+        x0 = cx * MAP_CHUNK_SIZE
+        y0 = cy * MAP_CHUNK_SIZE
+        for y in range(y0, min(y0 + MAP_CHUNK_SIZE, self.height)):
+            for x in range(x0, min(x0 + MAP_CHUNK_SIZE, self.width)):
+                center = self.world_to_screen((x, y)) - self.origin + offset
                 color = TILE_COLOR_1 if (x+y) % 2 == 0 else TILE_COLOR_2
                 points = [
                     (center.x, center.y - half_h),
@@ -70,21 +186,18 @@ class IsoMap:
                     pygame.draw.line(
                         surface,
                         GRASS_DETAIL_COLOR,
-                        (center.x - 2, center.y),
-                        (center.x + 2, center.y - 3),
+                        (center.x - 2 * self.zoom, center.y),
+                        (center.x + 2 * self.zoom, center.y - 3 * self.zoom),
                         1,
                     )
+
+    def _group_decorations(self):
+        """Bucket decorations by the chunk they are drawn in."""
+        chunks = {}
         for kind, pos in self.decorations:
-            base = self.world_to_screen(pos)
-            if kind == "tree":
-                trunk_rect = pygame.Rect(base.x - 3, base.y - 14, 6, 12)
-                pygame.draw.rect(surface, TREE_TRUNK_COLOR, trunk_rect)
-                pygame.draw.circle(surface, TREE_COLOR, (int(base.x), int(base.y - 20)), 12)
-            elif kind == "rock":
-                rock_rect = pygame.Rect(base.x - 8, base.y - 6, 16, 12)
-                pygame.draw.ellipse(surface, ROCK_COLOR, rock_rect)
-            else:
-                pygame.draw.circle(surface, FLOWER_COLOR, (int(base.x), int(base.y - 8)), 5)
+            key = (int(pos.x) // MAP_CHUNK_SIZE, int(pos.y) // MAP_CHUNK_SIZE)
+            chunks.setdefault(key, []).append((kind, pos))
+        return chunks
 
     def _generate_decorations(self):
         """Create a deterministic list of decoration positions."""
@@ -104,5 +217,3 @@ class IsoMap:
                 elif roll < TREE_CHANCE + ROCK_CHANCE + FLOWER_CHANCE:
                     decorations.append(("flower", pygame.Vector2(x, y)))
         return decorations
-    
-        
@@ -1,11 +1,33 @@
+import argparse
+from pathlib import Path
+
 from .game import Game
+from .profiling import AllocationProfiler
+from .settings import PROFILE_SNAPSHOT_INTERVAL
 
 
 def main():
     """Entry point to start the game."""
-    game = Game()
+    parser = argparse.ArgumentParser(description="Isometric zombie shooter.")
+    parser.add_argument(
+        "--profile-allocations", action="store_true",
+        help="trace allocations and GC pauses while playing",
+    )
+    parser.add_argument("--profile-interval", type=float, default=PROFILE_SNAPSHOT_INTERVAL)
+    parser.add_argument("--profile-report", type=Path, help="rewrite this file on every snapshot")
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile_allocations:
+        profiler = AllocationProfiler(args.profile_interval, report_path=args.profile_report)
+    game = Game(profiler)
+    if profiler is not None:
+        profiler.start()
     game.run()
+    if profiler is not None:
+        profiler.stop()
+        print(profiler.report())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
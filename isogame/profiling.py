@@ -0,0 +1,183 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from .settings import PROFILE_SNAPSHOT_INTERVAL, PROFILE_TRACEBACK_DEPTH, PROFILE_FILES
+
+
+class AllocationProfiler:
+    """Allocation and GC profiler for long-running sessions.
+
+    Takes tracemalloc snapshots every snapshot_interval seconds of game time,
+    records per-frame allocation figures and times every garbage collection
+    through gc.callbacks. report() attributes memory growth since the first
+    interval snapshot to call sites in the watched files; memory allocated
+    during the first interval counts as warm-up, not growth.
+
+    Args:
+        snapshot_interval (float): Game seconds between snapshots.
+        traceback_depth (int): Frames stored per allocation.
+        files (tuple[str, ...]): Module file names growth is attributed to.
+        report_path (pathlib.Path | None): Written with report() on each snapshot.
+
+    Attributes:
+        frames (int): Frames profiled so far.
+        elapsed (float): Game seconds profiled so far.
+        frame_blocks (deque): Net allocated memory blocks per recent frame.
+        frame_peaks (deque): Peak traced bytes above the frame start per recent frame.
+        gc_collections (list[int]): Collections per generation.
+        gc_pauses (list[float]): Total pause seconds per generation.
+        gc_max_pause (float): Longest single collection in seconds.
+        history (deque): (elapsed, traced bytes) at every snapshot.
+    """
+
+    def __init__(
+        self,
+        snapshot_interval=PROFILE_SNAPSHOT_INTERVAL,
+        traceback_depth=PROFILE_TRACEBACK_DEPTH,
+        files=PROFILE_FILES,
+        report_path=None,
+    ):
+        """Prepare counters; nothing is traced until start()."""
+        self.snapshot_interval = snapshot_interval
+        self.traceback_depth = traceback_depth
+        self.files = tuple(os.sep + os.path.join("isogame", name) for name in files)
+        self.report_path = report_path
+        self.frames = 0
+        self.elapsed = 0.0
+        self.frame_blocks = deque(maxlen=10_000)
+        self.frame_peaks = deque(maxlen=10_000)
+        self.gc_collections = [0, 0, 0]
+        self.gc_pauses = [0.0, 0.0, 0.0]
+        self.gc_max_pause = 0.0
+        self.history = deque(maxlen=1000)
+        self.baseline = None
+        self.latest = None
+        self.traced_memory = (0, 0)
+        self._next_snapshot = snapshot_interval
+        self._frame_start_blocks = 0
+        self._frame_start_bytes = 0
+        self._gc_start = None
+
+    def start(self):
+        """Start tracing allocations and timing collections.
+
+        The baseline is taken at the first interval snapshot, not here.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+        gc.callbacks.append(self._on_gc)
+
+    def stop(self):
+        """Take a final snapshot and stop tracing."""
+        self.latest = self._take_snapshot()
+        if self.baseline is None:
+            self.baseline = self.latest
+        self.traced_memory = tracemalloc.get_traced_memory()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        self._frame_start_blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        self._frame_start_bytes = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self, dt):
+        """Record the frame and take a snapshot when the interval has passed."""
+        _, peak = tracemalloc.get_traced_memory()
+        self.frame_blocks.append(sys.getallocatedblocks() - self._frame_start_blocks)
+        self.frame_peaks.append(peak - self._frame_start_bytes)
+        self.frames += 1
+        self.elapsed += dt
+        if self.elapsed >= self._next_snapshot:
+            self._next_snapshot += self.snapshot_interval
+            self.latest = self._take_snapshot()
+            if self.baseline is None:
+                self.baseline = self.latest
+            if self.report_path is not None:
+                self.report_path.write_text(self.report())
+
+    def growth(self):
+        """Traced bytes gained between the first and the latest snapshot."""
+        if self.baseline is None:
+            return 0
+        return self._traced_size(self.latest) - self._traced_size(self.baseline)
+
+    def growth_by_site(self, limit=10):
+        """Return [(file:line, size diff, count diff)] for the watched files.
+
+        Each allocation is charged to the innermost frame of its traceback
+        that lies in a watched file, so growth inside pygame or the standard
+        library shows up at the call site that caused it.
+        """
+        if self.baseline is None:
+            return []
+        sites = {}
+        for stat in self.latest.compare_to(self.baseline, "traceback"):
+            if stat.size_diff == 0 and stat.count_diff == 0:
+                continue
+            for frame in reversed(stat.traceback):
+                if frame.filename.endswith(self.files):
+                    site = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+                    size, count = sites.get(site, (0, 0))
+                    sites[site] = (size + stat.size_diff, count + stat.count_diff)
+                    break
+        ranked = sorted(sites.items(), key=lambda item: abs(item[1][0]), reverse=True)
+        return [(site, size, count) for site, (size, count) in ranked[:limit]]
+
+    def report(self, limit=10):
+        """Return a plain text summary of allocations, GC pauses and growth."""
+        if tracemalloc.is_tracing():
+            self.traced_memory = tracemalloc.get_traced_memory()
+        current, peak = self.traced_memory
+        frames = max(1, len(self.frame_blocks))
+        lines = [
+            f"Profiled {self.frames} frames over {self.elapsed:.1f} s",
+            f"Traced memory: {current / 1024:.1f} KiB current, {peak / 1024:.1f} KiB peak",
+            f"Growth since first snapshot: {self.growth() / 1024:+.1f} KiB",
+            "Per frame: "
+            f"{sum(self.frame_blocks) / frames:+.1f} net blocks avg, "
+            f"{sum(self.frame_peaks) / frames / 1024:.1f} KiB transient avg, "
+            f"{max(self.frame_peaks, default=0) / 1024:.1f} KiB transient max",
+        ]
+        for generation in range(3):
+            count = self.gc_collections[generation]
+            pause = self.gc_pauses[generation]
+            lines.append(
+                f"GC gen {generation}: {count} collections, {pause * 1000:.2f} ms total"
+            )
+        lines.append(f"GC longest pause: {self.gc_max_pause * 1000:.2f} ms")
+        lines.append("Growth by call site:")
+        for site, size, count in self.growth_by_site(limit):
+            lines.append(f"  {site:<20} {size / 1024:+9.1f} KiB {count:+8d} blocks")
+        return "\n".join(lines)
+
+    def _take_snapshot(self):
+        """Snapshot traced memory, leaving out tracemalloc and the profiler itself."""
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        self.history.append((self.elapsed, self._traced_size(snapshot)))
+        return snapshot
+
+    @staticmethod
+    def _traced_size(snapshot):
+        return sum(trace.size for trace in snapshot.traces)
+
+    def _on_gc(self, phase, info):
+        """gc.callbacks hook that times each collection."""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause = time.perf_counter() - self._gc_start
+            generation = info["generation"]
+            self.gc_collections[generation] += 1
+            self.gc_pauses[generation] += pause
+            self.gc_max_pause = max(self.gc_max_pause, pause)
+            self._gc_start = None
@@ -0,0 +1,168 @@
+import struct
+from .settings import NET_POSITION_SCALE
+
+MSG_WELCOME = 0
+MSG_INPUT = 1
+MSG_SNAPSHOT = 2
+
+BUTTON_UP = 1
+BUTTON_DOWN = 2
+BUTTON_LEFT = 4
+BUTTON_RIGHT = 8
+BUTTON_FIRE = 16
+
+KINDS = ("player", "zombie", "bullet", "powerup")
+POWERUP_KINDS = ("heal", "speed")
+
+FRAME = struct.Struct("!I")
+WELCOME = struct.Struct("!BH")
+INPUT = struct.Struct("!BIIBhh")
+SNAPSHOT_HEADER = struct.Struct("!BII")
+SECTION = struct.Struct("!HHH")
+MOVED = struct.Struct("!Hbb")
+REMOVED = struct.Struct("!H")
+FULL_RECORDS = {
+    "player": struct.Struct("!HhhHH"),
+    "zombie": struct.Struct("!Hhh"),
+    "bullet": struct.Struct("!Hhh"),
+    "powerup": struct.Struct("!HhhB"),
+}
+
+
+def quantize(value):
+    """Map a world coordinate to a signed 16-bit fixed point value."""
+    return max(-32768, min(32767, round(value * NET_POSITION_SCALE)))
+
+
+def dequantize(value):
+    """Map a fixed point value back to a world coordinate."""
+    return value / NET_POSITION_SCALE
+
+
+def empty_state():
+    """Return a snapshot state with no entities."""
+    return {kind: {} for kind in KINDS}
+
+
+def encode_welcome(player_id):
+    return WELCOME.pack(MSG_WELCOME, player_id)
+
+
+def decode_welcome(data):
+    _, player_id = WELCOME.unpack(data)
+    return player_id
+
+
+def encode_input(seq, ack, buttons, aim):
+    """Pack one client input: held buttons, aim point and last snapshot seen."""
+    return INPUT.pack(MSG_INPUT, seq, ack, buttons, quantize(aim[0]), quantize(aim[1]))
+
+
+def decode_input(data):
+    """Return (seq, ack, buttons, aim) from an input message."""
+    _, seq, ack, buttons, aim_x, aim_y = INPUT.unpack(data)
+    return seq, ack, buttons, (dequantize(aim_x), dequantize(aim_y))
+
+
+def encode_snapshot(tick, state, baseline_tick=0, baseline=None):
+    """Pack a snapshot, delta-compressed against an acknowledged baseline.
+
+    Entities that are identical to the baseline are omitted, entities that
+    only moved a little are sent as 8-bit position deltas and everything
+    else is sent in full. Entities missing from state are listed as removed.
+
+    Args:
+        tick (int): Server tick of the snapshot, starting at 1.
+        state (dict): Kind -> {entity id -> tuple of quantized fields}.
+        baseline_tick (int): Tick the client acknowledged, 0 for a full snapshot.
+        baseline (dict | None): State that was sent at baseline_tick.
+    """
+    if baseline is None:
+        baseline_tick = 0
+        baseline = empty_state()
+    parts = [SNAPSHOT_HEADER.pack(MSG_SNAPSHOT, tick, baseline_tick)]
+    for kind in KINDS:
+        current = state[kind]
+        previous = baseline[kind]
+        record = FULL_RECORDS[kind]
+        full = []
+        moved = []
+        for entity_id, fields in current.items():
+            old = previous.get(entity_id)
+            if old == fields:
+                continue
+            if old is not None and old[2:] == fields[2:]:
+                dx = fields[0] - old[0]
+                dy = fields[1] - old[1]
+                if -128 <= dx <= 127 and -128 <= dy <= 127:
+                    moved.append(MOVED.pack(entity_id, dx, dy))
+                    continue
+            full.append(record.pack(entity_id, *fields))
+        removed = [REMOVED.pack(entity_id) for entity_id in previous if entity_id not in current]
+        parts.append(SECTION.pack(len(full), len(moved), len(removed)))
+        parts.extend(full)
+        parts.extend(moved)
+        parts.extend(removed)
+    return b"".join(parts)
+
+
+def decode_snapshot(data, baselines):
+    """Rebuild the full state of a snapshot.
+
+    Args:
+        data (bytes): Encoded snapshot.
+        baselines (dict): Tick -> previously decoded state.
+
+    Returns:
+        tuple[int, dict]: Snapshot tick and its full state.
+
+    Raises:
+        ValueError: If the referenced baseline is unknown.
+    """
+    _, tick, baseline_tick = SNAPSHOT_HEADER.unpack_from(data)
+    if baseline_tick == 0:
+        baseline = empty_state()
+    elif baseline_tick in baselines:
+        baseline = baselines[baseline_tick]
+    else:
+        raise ValueError(f"unknown baseline tick {baseline_tick}")
+    offset = SNAPSHOT_HEADER.size
+    state = {}
+    for kind in KINDS:
+        entities = dict(baseline[kind])
+        record = FULL_RECORDS[kind]
+        full_count, moved_count, removed_count = SECTION.unpack_from(data, offset)
+        offset += SECTION.size
+        for _ in range(full_count):
+            entity_id, *fields = record.unpack_from(data, offset)
+            entities[entity_id] = tuple(fields)
+            offset += record.size
+        for _ in range(moved_count):
+            entity_id, dx, dy = MOVED.unpack_from(data, offset)
+            old = entities[entity_id]
+            entities[entity_id] = (old[0] + dx, old[1] + dy, *old[2:])
+            offset += MOVED.size
+        for _ in range(removed_count):
+            (entity_id,) = REMOVED.unpack_from(data, offset)
+            del entities[entity_id]
+            offset += REMOVED.size
+        state[kind] = entities
+    return tick, state
+
+
+async def read_message(reader, max_length=None):
+    """Read one length-prefixed message from an asyncio stream.
+
+    Raises:
+        ValueError: If the frame is longer than max_length.
+    """
+    header = await reader.readexactly(FRAME.size)
+    (length,) = FRAME.unpack(header)
+    if max_length is not None and length > max_length:
+        raise ValueError(f"frame of {length} bytes exceeds {max_length}")
+    return await reader.readexactly(length)
+
+
+def write_message(writer, payload):
+    """Queue one length-prefixed message on an asyncio stream."""
+    writer.write(FRAME.pack(len(payload)) + payload)
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+
+class SurfaceCache:
+    """Least-recently-used cache of pre-rendered surfaces with a byte budget.
+
+    Args:
+        max_bytes (int): Upper bound on the pixel memory held by the cache.
+
+    Attributes:
+        max_bytes (int): Memory budget in bytes.
+        used_bytes (int): Pixel memory currently held.
+    """
+
+    def __init__(self, max_bytes):
+        """Create an empty cache with the given memory budget."""
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, build):
+        """Return the surface stored under key, building it on a miss."""
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            return surface
+        surface = build()
+        self._entries[key] = surface
+        self.used_bytes += self._size_of(surface)
+        self._evict()
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def _evict(self):
+        """Drop least recently used surfaces until the budget is respected.
+
+        The newest entry is always kept so a single oversized surface can
+        still be drawn.
+        """
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:
+            _, surface = self._entries.popitem(last=False)
+            self.used_bytes -= self._size_of(surface)
+
+    @staticmethod
+    def _size_of(surface):
+        """Approximate pixel memory of a surface in bytes."""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
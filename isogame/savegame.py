@@ -0,0 +1,202 @@
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+
+import pygame
+
+from .entities import Zombie, Bullet, PowerUp
+from .world import World
+
+MAGIC = b"ISOR"
+VERSION = 1
+
+HEADER = struct.Struct("<4sH")
+ROUND = struct.Struct("<8i5d")
+PLAYER = struct.Struct("<6d2i")
+COUNTS = struct.Struct("<3I")
+RNG = struct.Struct("<i625IBd")
+
+UPGRADE_KINDS = ("hp", "speed", "bullet", "fire")
+POWERUP_KINDS = ("heal", "speed")
+
+
+def _pack_array(typecode, values):
+    """Return little-endian bytes for a typed array."""
+    data = array(typecode, values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _unpack_array(typecode, view, offset, count):
+    """Read count little-endian items of a typed array from a buffer."""
+    data = array(typecode)
+    size = data.itemsize * count
+    data.frombytes(view[offset:offset + size])
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data, offset + size
+
+
+def _remaining(timer):
+    return 0.0 if timer is None else timer.remaining
+
+
+def encode_round(world):
+    """Serialize a single-player World to bytes.
+
+    The layout is a fixed header followed by column arrays per entity type,
+    so large rounds pack and unpack without per-entity struct calls.
+    """
+    pilot = world.pilots[0]
+    player = pilot.player
+    zombies = world.zombies
+    bullets = world.bullets
+    powerups = world.powerups
+    rng_version, rng_state, gauss_next = world.rng.getstate()
+    parts = [
+        HEADER.pack(MAGIC, VERSION),
+        ROUND.pack(
+            pilot.score, pilot.upgrade_points, pilot.next_upgrade_score, world.zombies_spawned,
+            *(pilot.upgrades[kind] for kind in UPGRADE_KINDS),
+            _remaining(world.spawn_timer), _remaining(world.powerup_timer),
+            _remaining(pilot.speed_boost_timer), pilot.bullet_speed_bonus, pilot.fire_rate_bonus,
+        ),
+        PLAYER.pack(
+            player.pos.x, player.pos.y, player.aim_dir.x, player.aim_dir.y,
+            player.speed, _remaining(player.hit_timer), player.hp, player.max_hp,
+        ),
+        RNG.pack(rng_version, *rng_state, gauss_next is not None, gauss_next or 0.0),
+        COUNTS.pack(len(zombies), len(bullets), len(powerups)),
+        _pack_array("d", [z.pos.x for z in zombies]),
+        _pack_array("d", [z.pos.y for z in zombies]),
+        _pack_array("d", [z.speed for z in zombies]),
+        _pack_array("d", [b.pos.x for b in bullets]),
+        _pack_array("d", [b.pos.y for b in bullets]),
+        _pack_array("d", [b.velocity.x for b in bullets]),
+        _pack_array("d", [b.velocity.y for b in bullets]),
+        _pack_array("d", [b.remaining for b in bullets]),
+        _pack_array("d", [p.pos.x for p in powerups]),
+        _pack_array("d", [p.pos.y for p in powerups]),
+        _pack_array("B", [POWERUP_KINDS.index(p.kind) for p in powerups]),
+    ]
+    return b"".join(parts)
+
+
+def decode_round(buffer, iso_map=None, rng=random):
+    """Rebuild the World saved by encode_round.
+
+    Args:
+        iso_map (IsoMap | None): Map for the restored world.
+        rng: Random source the saved generator state is restored into.
+
+    Raises:
+        ValueError: If the buffer is not a complete save of this version.
+    """
+    view = memoryview(buffer)
+    try:
+        magic, version = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"unsupported save format {magic!r} v{version}")
+        offset = HEADER.size
+
+        fields = ROUND.unpack_from(view, offset)
+        offset += ROUND.size
+        player_fields = PLAYER.unpack_from(view, offset)
+        offset += PLAYER.size
+        rng_fields = RNG.unpack_from(view, offset)
+        offset += RNG.size
+        zombie_count, bullet_count, powerup_count = COUNTS.unpack_from(view, offset)
+        offset += COUNTS.size
+
+        zombie_x, offset = _unpack_array("d", view, offset, zombie_count)
+        zombie_y, offset = _unpack_array("d", view, offset, zombie_count)
+        zombie_speed, offset = _unpack_array("d", view, offset, zombie_count)
+        bullet_x, offset = _unpack_array("d", view, offset, bullet_count)
+        bullet_y, offset = _unpack_array("d", view, offset, bullet_count)
+        bullet_vx, offset = _unpack_array("d", view, offset, bullet_count)
+        bullet_vy, offset = _unpack_array("d", view, offset, bullet_count)
+        bullet_remaining, offset = _unpack_array("d", view, offset, bullet_count)
+        powerup_x, offset = _unpack_array("d", view, offset, powerup_count)
+        powerup_y, offset = _unpack_array("d", view, offset, powerup_count)
+        powerup_kind, offset = _unpack_array("B", view, offset, powerup_count)
+    except struct.error as exc:
+        raise ValueError("truncated save") from exc
+    finally:
+        view.release()
+    if offset > len(buffer):
+        raise ValueError("truncated save")
+
+    world = World(iso_map, rng=rng)
+    pilot = world.add_pilot()
+    (
+        pilot.score, pilot.upgrade_points, pilot.next_upgrade_score, world.zombies_spawned,
+        *upgrade_levels,
+    ) = fields[:8]
+    pilot.upgrades = dict(zip(UPGRADE_KINDS, upgrade_levels))
+    spawn_delay, powerup_delay, speed_boost = fields[8:11]
+    pilot.bullet_speed_bonus, pilot.fire_rate_bonus = fields[11:]
+
+    world.restore_timers(spawn_delay, powerup_delay)
+    if speed_boost > 0:
+        pilot.start_speed_boost(speed_boost)
+
+    pos_x, pos_y, aim_x, aim_y, speed, hit_timer, hp, max_hp = player_fields
+    player = pilot.player
+    player.pos = pygame.Vector2(pos_x, pos_y)
+    player.aim_dir = pygame.Vector2(aim_x, aim_y)
+    pilot.aim = player.pos + player.aim_dir
+    player.speed = speed
+    if hit_timer > 0:
+        player.make_invulnerable(hit_timer)
+    player.hp = hp
+    player.max_hp = max_hp
+
+    rng_version, *rng_state, has_gauss, gauss_next = rng_fields
+    rng.setstate((rng_version, tuple(rng_state), gauss_next if has_gauss else None))
+
+    world.zombies = [
+        Zombie((x, y), speed) for x, y, speed in zip(zombie_x, zombie_y, zombie_speed)
+    ]
+    for x, y, vx, vy, remaining in zip(bullet_x, bullet_y, bullet_vx, bullet_vy, bullet_remaining):
+        bullet = Bullet((x, y), (vx, vy), 1.0, owner=pilot)
+        bullet.remaining = remaining
+        world.bullets.append(bullet)
+    world.powerups = [
+        PowerUp((x, y), POWERUP_KINDS[kind]) for x, y, kind in zip(powerup_x, powerup_y, powerup_kind)
+    ]
+    return world
+
+
+def save_round(world, path):
+    """Write a single-player World to a file.
+
+    The data goes to a sibling temporary file that then replaces path, so a
+    crash mid-write leaves the previous save intact. The temporary file is
+    removed again if writing fails.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(temp_path, "wb") as handle:
+            handle.write(encode_round(world))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_round(path, iso_map=None, rng=random, use_mmap=True):
+    """Load the World saved in a file, memory-mapping it when requested."""
+    with open(path, "rb") as handle:
+        if not use_mmap:
+            return decode_round(handle.read(), iso_map, rng)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_round(mapped, iso_map, rng)
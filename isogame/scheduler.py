@@ -0,0 +1,104 @@
+import heapq
+import itertools
+
+
+class Timer:
+    """Handle to a scheduled callback.
+
+    Attributes:
+        due (float): Scheduler time at which the callback runs next.
+        interval (float | None): Repeat interval, None for one-shot timers.
+        active (bool): True until the timer fires (one-shot) or is cancelled.
+    """
+
+    def __init__(self, scheduler, due, callback, interval):
+        self.scheduler = scheduler
+        self.due = due
+        self.callback = callback
+        self.interval = interval
+        self.active = True
+
+    @property
+    def remaining(self):
+        """Seconds until the next run, 0 for inactive timers."""
+        if not self.active:
+            return 0.0
+        return max(0.0, self.due - self.scheduler.now)
+
+    def cancel(self):
+        """Stop the timer; its heap entry is dropped lazily or by compaction."""
+        if self.active:
+            self.active = False
+            self.scheduler._discard()
+
+
+class Scheduler:
+    """Heap-based scheduler for one-shot and repeating callbacks.
+
+    advance() only touches timers that are due, so the per-tick cost is
+    O(expired * log n) no matter how many timers are pending. Cancelled
+    timers stay in the heap until they reach the top, unless they make up
+    more than half of it, in which case the heap is rebuilt from the live
+    entries.
+
+    Attributes:
+        now (float): Seconds advanced since creation or the last clear().
+    """
+
+    def __init__(self):
+        """Create an empty scheduler at time 0."""
+        self.now = 0.0
+        self._heap = []
+        self._order = itertools.count()
+        self._live = 0
+        self._cancelled = 0
+
+    def __len__(self):
+        return self._live
+
+    def schedule(self, delay, callback, interval=None):
+        """Run callback after delay seconds, then every interval if given."""
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be positive")
+        timer = Timer(self, self.now + delay, callback, interval)
+        heapq.heappush(self._heap, (timer.due, next(self._order), timer))
+        self._live += 1
+        return timer
+
+    def advance(self, dt):
+        """Move time forward by dt and run every callback that came due.
+
+        Repeating timers that fell behind run once per missed interval.
+        """
+        self.now += dt
+        heap = self._heap
+        while heap and heap[0][0] <= self.now:
+            due, _, timer = heapq.heappop(heap)
+            if not timer.active:
+                self._cancelled -= 1
+                continue
+            if timer.interval is None:
+                timer.active = False
+                self._live -= 1
+            else:
+                timer.due = due + timer.interval
+                heapq.heappush(heap, (timer.due, next(self._order), timer))
+            timer.callback()
+
+    def clear(self):
+        """Cancel every timer and reset the clock."""
+        for _, _, timer in self._heap:
+            timer.active = False
+        self._heap.clear()
+        self._live = 0
+        self._cancelled = 0
+        self.now = 0.0
+
+    def _discard(self):
+        """Account for a cancelled timer and compact the heap if needed."""
+        self._live -= 1
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap[:] = [entry for entry in self._heap if entry[2].active]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
@@ -0,0 +1,277 @@
+import asyncio
+import random
+import struct
+import time
+from itertools import chain
+import pygame
+
+from .entities import Player
+from .world import World, SPAWN_POINT
+from .protocol import (
+    BUTTON_UP, BUTTON_DOWN, BUTTON_LEFT, BUTTON_RIGHT, BUTTON_FIRE,
+    INPUT, POWERUP_KINDS, empty_state, quantize, encode_welcome, decode_input,
+    encode_snapshot, read_message, write_message,
+)
+from .settings import (
+    MAX_ZOMBIES,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_TICK_RATE,
+    SNAPSHOT_HISTORY,
+    SERVER_WRITE_BUFFER_LIMIT,
+)
+
+
+def button_keys(buttons):
+    """Translate held buttons to the key mapping Player.update reads."""
+    return {
+        pygame.K_w: bool(buttons & BUTTON_UP),
+        pygame.K_s: bool(buttons & BUTTON_DOWN),
+        pygame.K_a: bool(buttons & BUTTON_LEFT),
+        pygame.K_d: bool(buttons & BUTTON_RIGHT),
+    }
+
+
+class ServerWorld(World):
+    """World shared by several networked players.
+
+    Runs the same rules as the single-player game, except that zombies
+    chase the nearest player and a player that dies respawns instead of
+    ending the round. Entities get stable 16-bit ids for snapshots.
+
+    Args:
+        max_zombies (int): Cap on the size of the horde.
+        rng (random.Random | None): Random source for spawns.
+    """
+
+    def __init__(self, max_zombies=MAX_ZOMBIES, rng=None):
+        """Create a world with no players."""
+        super().__init__(max_zombies=max_zombies, rng=rng or random.Random())
+        self.players = {}
+        self._entity_ids = {}
+        self._next_id = 1
+
+    def add_player(self):
+        """Add a player and return its id."""
+        player_id = self._allocate_id(self.players.keys())
+        self.players[player_id] = self.add_pilot()
+        return player_id
+
+    def remove_player(self, player_id):
+        pilot = self.players.pop(player_id, None)
+        if pilot is not None:
+            self.remove_pilot(pilot)
+
+    def set_input(self, player_id, buttons, aim):
+        """Store the latest input of a player; it is applied every step."""
+        pilot = self.players.get(player_id)
+        if pilot is not None:
+            pilot.keys = button_keys(buttons)
+            pilot.aim = pygame.Vector2(aim)
+            pilot.firing = bool(buttons & BUTTON_FIRE)
+
+    def step(self, dt):
+        """Advance the simulation by dt seconds and respawn dead players."""
+        super().step(dt)
+        for pilot in self.dead_pilots():
+            pilot.cancel_timers()
+            pilot.player = Player(SPAWN_POINT, self.scheduler)
+            pilot.score = 0
+
+    def snapshot(self):
+        """Return the quantized state sent to clients."""
+        ids = self._assign_entity_ids()
+        state = empty_state()
+        for player_id, pilot in self.players.items():
+            pos = pilot.player.pos
+            state["player"][player_id] = (
+                quantize(pos.x), quantize(pos.y),
+                min(pilot.player.hp, 0xFFFF), min(pilot.score, 0xFFFF),
+            )
+        for zombie in self.zombies:
+            state["zombie"][ids[zombie]] = (quantize(zombie.pos.x), quantize(zombie.pos.y))
+        for bullet in self.bullets:
+            state["bullet"][ids[bullet]] = (quantize(bullet.pos.x), quantize(bullet.pos.y))
+        for powerup in self.powerups:
+            state["powerup"][ids[powerup]] = (
+                quantize(powerup.pos.x), quantize(powerup.pos.y),
+                POWERUP_KINDS.index(powerup.kind),
+            )
+        return state
+
+    def _chase_target(self, zombie):
+        """Zombies go after the nearest player."""
+        targets = (pilot.player.pos for pilot in self.pilots)
+        return min(targets, key=zombie.pos.distance_squared_to)
+
+    def _assign_entity_ids(self):
+        """Map every live zombie, bullet and powerup to its snapshot id.
+
+        Entities keep the id they got in earlier snapshots; new ones get
+        the next free id, so clients can match records across ticks.
+        """
+        entities = list(chain(self.zombies, self.bullets, self.powerups))
+        previous = self._entity_ids
+        ids = {entity: previous[entity] for entity in entities if entity in previous}
+        used = set(ids.values())
+        for entity in entities:
+            if entity not in ids:
+                entity_id = self._allocate_id(used)
+                used.add(entity_id)
+                ids[entity] = entity_id
+        self._entity_ids = ids
+        return ids
+
+    def _allocate_id(self, used):
+        """Return the next 16-bit id not in used."""
+        while True:
+            entity_id = self._next_id
+            self._next_id = self._next_id % 0xFFFF + 1
+            if entity_id not in used:
+                return entity_id
+
+
+class ClientConnection:
+    """A connected client and the last snapshot it acknowledged."""
+
+    def __init__(self, player_id, writer):
+        self.player_id = player_id
+        self.writer = writer
+        self.ack = 0
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+        self.snapshots_skipped = 0
+
+
+class GameServer:
+    """Authoritative server running a ServerWorld over localhost TCP.
+
+    Every tick the world is stepped once and each client receives a snapshot
+    delta-compressed against the last tick it acknowledged. A client whose
+    unsent data exceeds write_buffer_limit is skipped until it catches up;
+    its next snapshot is still a delta against what it acknowledged.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on, 0 picks a free one.
+        tick_rate (int): Simulation steps per second.
+        world (ServerWorld | None): World to run, a new one by default.
+        write_buffer_limit (int): Unsent bytes above which a client is skipped.
+    """
+
+    def __init__(
+        self,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        tick_rate=SERVER_TICK_RATE,
+        world=None,
+        write_buffer_limit=SERVER_WRITE_BUFFER_LIMIT,
+    ):
+        """Prepare the server without opening any socket."""
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.world = world or ServerWorld()
+        self.write_buffer_limit = write_buffer_limit
+        self.clients = {}
+        self.history = {}
+        self.tick_count = 0
+        self.tick_seconds = 0.0
+        self._server = None
+        self._tick_task = None
+        self._handlers = set()
+
+    async def start(self):
+        """Open the listening socket and start ticking."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tick_task = asyncio.create_task(self._run_ticks())
+
+    async def stop(self):
+        """Stop ticking and close every connection."""
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            try:
+                await self._tick_task
+            except asyncio.CancelledError:
+                pass
+        for client in list(self.clients.values()):
+            client.writer.close()
+        await asyncio.gather(*self._handlers)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def tick(self):
+        """Step the world once and send a snapshot to every client keeping up."""
+        start = time.perf_counter()
+        self.world.step(1.0 / self.tick_rate)
+        self.tick_count += 1
+        state = self.world.snapshot()
+        self.history[self.tick_count] = state
+        self.history.pop(self.tick_count - SNAPSHOT_HISTORY, None)
+        for client in self.clients.values():
+            if client.writer.transport.get_write_buffer_size() > self.write_buffer_limit:
+                client.snapshots_skipped += 1
+                continue
+            baseline = self.history.get(client.ack)
+            payload = encode_snapshot(self.tick_count, state, client.ack, baseline)
+            write_message(client.writer, payload)
+            client.bytes_sent += len(payload)
+            client.snapshots_sent += 1
+        self.tick_seconds += time.perf_counter() - start
+
+    async def _run_ticks(self):
+        interval = 1.0 / self.tick_rate
+        next_tick = time.perf_counter()
+        while True:
+            self.tick()
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    async def _handle_client(self, reader, writer):
+        """Register a player and apply its inputs until it disconnects.
+
+        A client sending an oversized or malformed input message is dropped.
+        """
+        self._handlers.add(asyncio.current_task())
+        player_id = self.world.add_player()
+        client = ClientConnection(player_id, writer)
+        self.clients[player_id] = client
+        write_message(writer, encode_welcome(player_id))
+        try:
+            while True:
+                data = await read_message(reader, INPUT.size)
+                _, ack, buttons, aim = decode_input(data)
+                client.ack = ack
+                self.world.set_input(player_id, buttons, aim)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, struct.error):
+            pass
+        finally:
+            del self.clients[player_id]
+            self.world.remove_player(player_id)
+            writer.close()
+            self._handlers.discard(asyncio.current_task())
+
+
+async def serve(host=SERVER_HOST, port=SERVER_PORT):
+    """Run a server until cancelled."""
+    server = GameServer(host, port)
+    await server.start()
+    print(f"Serving on {server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    """Entry point to start a local multiplayer server."""
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,11 @@ TILE_HEIGHT = 32
 MAP_WIDTH = 75
 MAP_HEIGHT = 75
 
+ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.5, 2.0)
+DEFAULT_ZOOM = 1.0
+MAP_CHUNK_SIZE = 16
+RENDER_CACHE_BYTES = 96 * 1024 * 1024
+
 BG_COLOR = (18, 20, 24)
 TILE_COLOR_1 = (70, 110, 90)
 TILE_COLOR_2 = (60, 95, 80)
@@ -70,3 +75,18 @@ UPGRADE_BULLET_SPEED_BONUS = 1.0
 FIRE_RATE = 6.0
 FIRE_RATE_BONUS = 0.8
 FIRE_HOLD_DELAY = 0.15
+
+AUTOSAVE_INTERVAL = 30.0
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 50007
+SERVER_TICK_RATE = 30
+SNAPSHOT_HISTORY = 64
+SERVER_WRITE_BUFFER_LIMIT = 64 * 1024
+NET_POSITION_SCALE = 128
+
+PROFILE_SNAPSHOT_INTERVAL = 60.0
+PROFILE_TRACEBACK_DEPTH = 8
+PROFILE_FILES = ("game.py", "world.py", "entities.py", "iso_map.py")
+SOAK_DT = 1 / 30
+SOAK_MAX_GROWTH = 1024 * 1024
@@ -0,0 +1,98 @@
+import argparse
+import os
+import sys
+
+import pygame
+
+from .game import Game
+from .profiling import AllocationProfiler
+from .settings import SOAK_DT, SOAK_MAX_GROWTH
+
+
+class SoakGame(Game):
+    """Game driven by a scripted player instead of the keyboard and mouse.
+
+    The player walks in a square, always holds fire and aims at the nearest
+    zombie, so rounds exercise movement, bullets, kills and deaths.
+    """
+
+    def _read_input(self):
+        """Return scripted keys, aim point and fire button."""
+        side = int(self.world.scheduler.now / 3) % 4
+        keys = {
+            pygame.K_w: side == 0,
+            pygame.K_d: side == 1,
+            pygame.K_s: side == 2,
+            pygame.K_a: side == 3,
+        }
+        player = self.pilot.player
+        if self.world.zombies:
+            target = min(self.world.zombies, key=lambda z: z.pos.distance_squared_to(player.pos)).pos
+        else:
+            target = player.pos + pygame.Vector2(1, 0)
+        return keys, self.map.world_to_screen(target), True
+
+    def _save_high_score(self):
+        """Soak runs never touch the real high score file."""
+
+    def _save_round(self):
+        """Nor the real save file."""
+
+    def _discard_round(self):
+        """Deaths must not delete it either."""
+
+
+def run_soak(hours, dt=SOAK_DT, draw=False, profiler=None):
+    """Run the headless game for a number of simulated hours.
+
+    The first tenth of the run is warm-up so caches and the horde reach
+    their steady size before the baseline snapshot is taken.
+
+    Returns:
+        AllocationProfiler: The stopped profiler with the collected data.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    profiler = profiler or AllocationProfiler(snapshot_interval=max(dt, hours * 3600 / 10))
+    game = SoakGame()
+    game._reset_round()
+    game.state = "play"
+
+    frames = max(1, int(hours * 3600 / dt))
+    warmup = frames // 10
+    for frame in range(frames):
+        if frame == warmup:
+            profiler.start()
+        profiling = frame >= warmup
+        if profiling:
+            profiler.begin_frame()
+        if game.state != "play":
+            game._reset_round()
+            game.state = "play"
+        game._update_game(dt)
+        if draw:
+            game._draw_game()
+        if profiling:
+            profiler.end_frame(dt)
+    profiler.stop()
+    pygame.quit()
+    return profiler
+
+
+def main():
+    """Entry point: python -m isogame.soak --hours 1."""
+    parser = argparse.ArgumentParser(description="Soak-test the headless game for memory growth.")
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--dt", type=float, default=SOAK_DT)
+    parser.add_argument("--draw", action="store_true", help="also render every frame")
+    parser.add_argument("--max-growth-kb", type=float, default=SOAK_MAX_GROWTH / 1024)
+    args = parser.parse_args()
+
+    profiler = run_soak(args.hours, args.dt, args.draw)
+    print(profiler.report())
+    if profiler.growth() > args.max_growth_kb * 1024:
+        print(f"Memory grew by more than {args.max_growth_kb:.0f} KiB")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
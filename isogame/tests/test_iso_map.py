@@ -1,4 +1,9 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
 import pygame
+from isogame.game import Game
 from isogame.iso_map import IsoMap
 
 
@@ -19,3 +24,45 @@ def test_origin_offset_affects_projection():
     base_screen = base_map.world_to_screen(world)
     offset_screen = offset_map.world_to_screen(world)
     assert offset_screen - base_screen == pygame.Vector2(120, 80)
+
+
+def test_zoom_round_trip_and_scale():
+    pygame.init()
+    iso_map = IsoMap(10, 10, 64, 32, origin=(40, 20), zoom=2.0)
+    world = pygame.Vector2(3.5, 4.0)
+    screen = iso_map.world_to_screen(world)
+    assert (iso_map.screen_to_world(screen) - world).length() < 0.001
+    assert screen - iso_map.origin == iso_map.world_to_iso(world) * 2.0
+
+
+def test_draw_reuses_cached_chunks():
+    pygame.init()
+    iso_map = IsoMap(40, 40, 64, 32, origin=(200, 50))
+    surface = pygame.Surface((400, 300))
+    iso_map.draw(surface)
+    cached = len(iso_map.cache)
+    assert cached > 0
+    iso_map.draw(surface)
+    assert len(iso_map.cache) == cached
+    iso_map.set_zoom(0.5)
+    iso_map.draw(surface)
+    assert len(iso_map.cache) > cached
+
+
+def test_decorations_share_one_sprite_per_kind():
+    pygame.init()
+    iso_map = IsoMap(40, 40, 64, 32, origin=(200, 50))
+    iso_map.draw(pygame.Surface((400, 300)))
+    kinds = {kind for kind, _ in iso_map.decorations}
+    for kind in kinds:
+        assert ("sprite", ("decoration", kind), iso_map.zoom) in iso_map.cache
+    assert len(iso_map.cache) <= len(kinds) + 9
+
+
+def test_zoom_steps_from_nearest_level():
+    game = Game()
+    game.map.set_zoom(1.4)
+    game._change_zoom(1)
+    assert game.map.zoom == 2.0
+    game._change_zoom(-10)
+    assert game.map.zoom == 0.5
@@ -0,0 +1,46 @@
+import gc
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from isogame.profiling import AllocationProfiler
+from isogame.settings import SOAK_MAX_GROWTH
+from isogame.soak import run_soak
+
+
+def test_profiler_times_collections_and_frames():
+    profiler = AllocationProfiler(snapshot_interval=1.0)
+    profiler.start()
+    try:
+        profiler.begin_frame()
+        garbage = [[i] for i in range(1000)]
+        gc.collect()
+        profiler.end_frame(1.0)
+    finally:
+        profiler.stop()
+    assert garbage
+    assert profiler.frames == 1
+    assert profiler.frame_peaks[0] > 0
+    assert profiler.gc_collections[2] >= 1
+    assert len(profiler.history) == 2
+
+
+def test_growth_ignores_warm_up_allocations():
+    profiler = AllocationProfiler(snapshot_interval=1.0)
+    profiler.start()
+    try:
+        startup = [bytearray(1024) for _ in range(2048)]
+        for _ in range(5):
+            profiler.begin_frame()
+            profiler.end_frame(1.0)
+    finally:
+        profiler.stop()
+    assert startup
+    assert profiler.growth() < 64 * 1024
+
+
+def test_soak_memory_stays_bounded():
+    profiler = run_soak(hours=0.005)
+    assert profiler.frames > 0
+    assert profiler.growth() < SOAK_MAX_GROWTH
+    assert "Growth by call site" in profiler.report()
@@ -0,0 +1,30 @@
+from isogame.protocol import (
+    BUTTON_FIRE, BUTTON_UP, empty_state, encode_input, decode_input,
+    encode_snapshot, decode_snapshot,
+)
+
+
+def _state(zombies):
+    state = empty_state()
+    state["player"][1] = (1200, 1300, 100, 4)
+    state["zombie"].update(zombies)
+    state["powerup"][9] = (640, 640, 1)
+    return state
+
+
+def test_input_round_trip():
+    data = encode_input(7, 42, BUTTON_UP | BUTTON_FIRE, (12.5, 3.25))
+    assert decode_input(data) == (7, 42, BUTTON_UP | BUTTON_FIRE, (12.5, 3.25))
+
+
+def test_delta_snapshot_rebuilds_state_and_is_smaller():
+    baseline = _state({2: (100, 100), 3: (200, 200), 4: (300, 300)})
+    current = _state({2: (100, 100), 3: (205, 198), 5: (5000, 0)})
+
+    tick, decoded = decode_snapshot(encode_snapshot(1, baseline), {})
+    assert (tick, decoded) == (1, baseline)
+
+    delta = encode_snapshot(2, current, 1, baseline)
+    tick, decoded = decode_snapshot(delta, {1: baseline})
+    assert (tick, decoded) == (2, current)
+    assert len(delta) < len(encode_snapshot(2, current))
@@ -0,0 +1,15 @@
+import pygame
+from isogame.render_cache import SurfaceCache
+
+
+def test_evicts_least_recently_used_over_budget():
+    surface_bytes = pygame.Surface((10, 10), pygame.SRCALPHA).get_bytesize() * 100
+    cache = SurfaceCache(surface_bytes * 2)
+    build = lambda: pygame.Surface((10, 10), pygame.SRCALPHA)
+    cache.get("a", build)
+    cache.get("b", build)
+    cache.get("a", build)
+    cache.get("c", build)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.used_bytes <= cache.max_bytes
@@ -0,0 +1,102 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest
+from isogame.entities import Bullet, PowerUp, Zombie
+from isogame import savegame
+from isogame.game import Game
+from isogame.settings import AUTOSAVE_INTERVAL
+from isogame.savegame import decode_round, encode_round, load_round, save_round
+from isogame.world import World
+
+
+def _populated_world(zombies):
+    world = World(rng=random.Random(3))
+    pilot = world.add_pilot()
+    world.zombies = [Zombie((i % 75, i / 200), 1 + i / 1000) for i in range(zombies)]
+    world.bullets = [Bullet((1, 2), (0.6, 0.8), 9.0, owner=pilot)]
+    world.powerups = [PowerUp((4, 5), "speed")]
+    pilot.score = 17
+    pilot.upgrades["fire"] = 2
+    world.scheduler.advance(0.75)
+    pilot.start_speed_boost(3.0)
+    pilot.player.hp = 42
+    return world
+
+
+def test_round_trip_restores_state_and_rng(tmp_path):
+    world = _populated_world(10_000)
+    path = tmp_path / "round.bin"
+    save_round(world, path)
+
+    restored = load_round(path, rng=random.Random())
+    assert encode_round(restored) == path.read_bytes()
+    assert restored.rng.random() == world.rng.random()
+    pilot = restored.pilots[0]
+    assert pilot.score == 17
+    assert pilot.upgrades == world.pilots[0].upgrades
+    assert restored.spawn_timer.remaining == 0.25
+    assert pilot.speed_boost_timer.remaining == 3.0
+    assert pilot.player.hp == 42
+    assert [z.pos for z in restored.zombies] == [z.pos for z in world.zombies]
+    assert restored.bullets[0].velocity == world.bullets[0].velocity
+    assert restored.powerups[0].kind == "speed"
+
+
+def test_rejects_truncated_save():
+    data = encode_round(_populated_world(10))
+    with pytest.raises(ValueError):
+        decode_round(data[:-8])
+    with pytest.raises(ValueError):
+        decode_round(data[:4] + b"\x02\x00" + data[6:])
+
+
+def test_save_replaces_file_without_leftovers(tmp_path):
+    path = tmp_path / "round.bin"
+    path.write_bytes(b"old")
+    save_round(_populated_world(10), path)
+    assert load_round(path).pilots[0].score == 17
+    assert [p.name for p in tmp_path.iterdir()] == ["round.bin"]
+
+
+def test_game_autosaves_on_a_timer(tmp_path):
+    game = Game()
+    game.save_path = tmp_path / "round.bin"
+    game._reset_round()
+    game.world.scheduler.advance(AUTOSAVE_INTERVAL - 1)
+    assert not game.save_path.exists()
+    game._update_game(1.0)
+    assert game.save_path.read_bytes() == encode_round(game.world)
+
+
+def test_lost_round_cannot_be_resumed(tmp_path):
+    game = Game()
+    game.save_path = tmp_path / "round.bin"
+    game._reset_round()
+    game._save_round()
+    game.pilot.player.hp = 0
+    game._update_game(1 / 30)
+    assert game.state == "game_over"
+    assert not game.save_path.exists()
+    assert not game._load_round()
+
+
+def test_failed_save_keeps_old_file_and_game_running(tmp_path, monkeypatch):
+    path = tmp_path / "round.bin"
+    path.write_bytes(b"old")
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(savegame.os, "fsync", fail)
+    with pytest.raises(OSError):
+        save_round(_populated_world(10), path)
+    assert [p.name for p in tmp_path.iterdir()] == ["round.bin"]
+    assert path.read_bytes() == b"old"
+
+    game = Game()
+    game.save_path = tmp_path / "round.bin"
+    game._reset_round()
+    assert not game._save_round()
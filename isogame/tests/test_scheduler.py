@@ -0,0 +1,40 @@
+from isogame.scheduler import Scheduler
+
+
+def test_one_shot_and_repeating_timers():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.schedule(0.5, lambda: calls.append("once"))
+    scheduler.schedule(0.2, lambda: calls.append("tick"), interval=0.2)
+    scheduler.advance(0.3)
+    assert calls == ["tick"]
+    scheduler.advance(0.25)
+    assert calls == ["tick", "tick", "once"]
+    scheduler.advance(0.5)
+    assert calls.count("tick") == 5
+    assert calls.count("once") == 1
+
+
+def test_cancelled_timer_never_fires():
+    scheduler = Scheduler()
+    calls = []
+    timer = scheduler.schedule(1.0, lambda: calls.append("boost"))
+    assert timer.remaining == 1.0
+    timer.cancel()
+    scheduler.advance(2.0)
+    assert calls == []
+    assert timer.remaining == 0.0
+    assert len(scheduler) == 0
+
+
+def test_cancelled_timers_are_compacted():
+    scheduler = Scheduler()
+    calls = []
+    timers = [scheduler.schedule(1.0 + i / 1000, lambda i=i: calls.append(i)) for i in range(1000)]
+    for timer in timers[:900]:
+        timer.cancel()
+    assert len(scheduler) == 100
+    assert len(scheduler._heap) <= 2 * len(scheduler)
+    scheduler.advance(2.0)
+    assert calls == list(range(900, 1000))
+    assert len(scheduler) == 0
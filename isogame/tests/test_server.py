@@ -0,0 +1,97 @@
+import asyncio
+import random
+import socket
+
+from isogame.client import NetClient
+from isogame.protocol import BUTTON_RIGHT, FRAME, empty_state, read_message
+from isogame.server import GameServer, ServerWorld
+from isogame.settings import SNAPSHOT_HISTORY
+
+
+def test_world_shares_horde_between_players():
+    world = ServerWorld(rng=random.Random(1))
+    first = world.add_player()
+    second = world.add_player()
+    world.spawn_zombie()
+    world.set_input(first, BUTTON_RIGHT, (0, 0))
+    for _ in range(30):
+        world.step(1 / 30)
+    state = world.snapshot()
+    assert set(state["player"]) == {first, second}
+    assert len(state["zombie"]) == 1
+    assert state["player"][first][:2] != state["player"][second][:2]
+
+
+def test_client_receives_snapshots():
+    async def scenario():
+        server = GameServer(port=0, world=ServerWorld(rng=random.Random(1)))
+        await server.start()
+        client = NetClient()
+        await client.connect(port=server.port)
+        for _ in range(10):
+            client.send_input(0, (0, 0))
+            await asyncio.sleep(1 / server.tick_rate)
+        await client.close()
+        await server.stop()
+        return client
+
+    client = asyncio.run(scenario())
+    assert client.tick > 0
+    assert client.player_id in client.state["player"]
+
+
+def test_server_skips_clients_that_stop_reading():
+    limit = 16 * 1024
+
+    async def scenario():
+        world = ServerWorld(rng=random.Random(1))
+        for _ in range(500):
+            world.spawn_zombie()
+        server = GameServer(port=0, world=world, write_buffer_limit=limit)
+        await server.start()
+        _, writer = await asyncio.open_connection(server.host, server.port)
+        while not server.clients:
+            await asyncio.sleep(0)
+        client = next(iter(server.clients.values()))
+        client.writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        for _ in range(300):
+            server.tick()
+        buffered = client.writer.transport.get_write_buffer_size()
+        writer.close()
+        await server.stop()
+        return client, buffered
+
+    client, buffered = asyncio.run(scenario())
+    assert client.snapshots_skipped > 0
+    assert buffered < limit + client.bytes_sent / client.snapshots_sent * 2
+
+
+def test_client_drops_old_baselines_across_skipped_ticks():
+    client = NetClient()
+    for tick in range(1, 1000, 3):
+        client._store_baseline(tick, empty_state())
+    assert len(client._baselines) <= SNAPSHOT_HISTORY
+    assert min(client._baselines) > 997 - SNAPSHOT_HISTORY
+
+
+def test_server_drops_clients_sending_bad_frames(caplog):
+    async def scenario():
+        server = GameServer(port=0, world=ServerWorld(rng=random.Random(1)))
+        await server.start()
+        for frame in (FRAME.pack(2) + b"\x02\x00", FRAME.pack(0xFFFFFFFF)):
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            await read_message(reader)
+            writer.write(frame)
+            while server.clients:
+                await asyncio.sleep(0.01)
+            writer.close()
+        client = NetClient()
+        await client.connect(port=server.port)
+        await asyncio.sleep(3 / server.tick_rate)
+        await client.close()
+        await server.stop()
+        return client
+
+    client = asyncio.run(scenario())
+    assert client.player_id in client.state["player"]
+    assert not [record for record in caplog.records if record.levelname == "ERROR"]
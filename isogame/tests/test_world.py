@@ -0,0 +1,37 @@
+import random
+
+import pytest
+from isogame.entities import Zombie
+from isogame.settings import BULLET_SPEED, UPGRADE_BULLET_SPEED_BONUS, ZOMBIE_SPAWN_INTERVAL
+from isogame.world import World
+
+
+def test_kill_credits_shooter_with_upgraded_weapon():
+    world = World(max_zombies=0, rng=random.Random(2))
+    pilot = world.add_pilot()
+    pilot.upgrade_points = 1
+    pilot.buy_upgrade("bullet")
+    player = pilot.player
+    world.zombies = [Zombie(player.pos + (6, 0))]
+    pilot.aim = player.pos + (6, 0)
+    pilot.firing = True
+    while not world.bullets:
+        world.step(1 / 30)
+    speed = world.bullets[0].velocity.length()
+    assert speed == pytest.approx(BULLET_SPEED + UPGRADE_BULLET_SPEED_BONUS)
+    for _ in range(30):
+        world.step(1 / 30)
+    assert pilot.score == 1
+    assert not world.zombies
+
+
+def test_full_horde_spawns_on_first_tick_with_room():
+    world = World(max_zombies=1, rng=random.Random(2))
+    world.add_pilot()
+    world.spawn_zombie()
+    world.step(ZOMBIE_SPAWN_INTERVAL * 1.5)
+    assert len(world.zombies) == 1
+    world.zombies.clear()
+    world.step(0.01)
+    assert len(world.zombies) == 1
+    assert world.spawn_timer.remaining == pytest.approx(ZOMBIE_SPAWN_INTERVAL)
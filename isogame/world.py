@@ -0,0 +1,292 @@
+import random
+import pygame
+
+from .entities import Player, Zombie, Bullet, PowerUp
+from .iso_map import IsoMap
+from .scheduler import Scheduler
+from .settings import (
+    TILE_WIDTH,
+    TILE_HEIGHT,
+    MAP_WIDTH,
+    MAP_HEIGHT,
+    MAX_ZOMBIES,
+    ZOMBIE_SPAWN_INTERVAL,
+    ZOMBIE_SPEED,
+    ZOMBIE_SPEED_GROWTH,
+    ZOMBIE_DAMAGE,
+    BULLET_SPEED,
+    POWERUP_SPAWN_INTERVAL,
+    MAX_POWERUPS,
+    POWERUP_HEAL_AMOUNT,
+    POWERUP_SPEED_BOOST,
+    POWERUP_SPEED_DURATION,
+    UPGRADE_SCORE_STEP,
+    MAX_UPGRADE_LEVEL,
+    UPGRADE_HP_BONUS,
+    UPGRADE_SPEED_BONUS,
+    UPGRADE_BULLET_SPEED_BONUS,
+    FIRE_RATE,
+    FIRE_RATE_BONUS,
+    FIRE_HOLD_DELAY,
+)
+
+SPAWN_POINT = (MAP_WIDTH / 2, MAP_HEIGHT / 2)
+NO_KEYS = {pygame.K_w: False, pygame.K_s: False, pygame.K_a: False, pygame.K_d: False}
+
+
+class Pilot:
+    """Round state of one player: its entity, score, upgrades and effects.
+
+    Attributes:
+        player (Player): The controlled entity.
+        keys (Mapping): Held movement keys, indexed like pygame.key.get_pressed().
+        aim (pygame.Vector2): World position the player aims at.
+        firing (bool): True while the fire button is held.
+        speed_boost_timer (Timer | None): Running speed powerup.
+        fire_timer (Timer | None): Next shot while firing.
+    """
+
+    def __init__(self, scheduler):
+        """Spawn the player in the map center with no input held."""
+        self.scheduler = scheduler
+        self.player = Player(SPAWN_POINT, scheduler)
+        self.score = 0
+        self.upgrade_points = 0
+        self.next_upgrade_score = UPGRADE_SCORE_STEP
+        self.upgrades = {"hp": 0, "speed": 0, "bullet": 0, "fire": 0}
+        self.bullet_speed_bonus = 0.0
+        self.fire_rate_bonus = 0.0
+        self.keys = NO_KEYS
+        self.aim = pygame.Vector2(SPAWN_POINT) + pygame.Vector2(1, 0)
+        self.firing = False
+        self.speed_boost_timer = None
+        self.fire_timer = None
+
+    @property
+    def speed_multiplier(self):
+        return POWERUP_SPEED_BOOST if self.speed_boost_timer is not None else 1.0
+
+    def fire_cooldown(self):
+        return 1.0 / (FIRE_RATE + self.fire_rate_bonus)
+
+    def add_kill(self):
+        """Count a kill and grant an upgrade point every UPGRADE_SCORE_STEP kills."""
+        self.score += 1
+        if self.score >= self.next_upgrade_score:
+            self.upgrade_points += 1
+            self.next_upgrade_score += UPGRADE_SCORE_STEP
+
+    def buy_upgrade(self, kind):
+        """Spend an upgrade point on "hp", "speed", "bullet" or "fire"."""
+        if self.upgrade_points <= 0 or self.upgrades[kind] >= MAX_UPGRADE_LEVEL:
+            return
+        self.upgrade_points -= 1
+        self.upgrades[kind] += 1
+        if kind == "hp":
+            self.player.max_hp += UPGRADE_HP_BONUS
+            self.player.hp += UPGRADE_HP_BONUS
+        elif kind == "speed":
+            self.player.speed += UPGRADE_SPEED_BONUS
+        elif kind == "bullet":
+            self.bullet_speed_bonus += UPGRADE_BULLET_SPEED_BONUS
+        elif kind == "fire":
+            self.fire_rate_bonus += FIRE_RATE_BONUS
+
+    def start_speed_boost(self, duration):
+        """Apply the speed powerup, restarting it if already active."""
+        if self.speed_boost_timer is not None:
+            self.speed_boost_timer.cancel()
+        self.speed_boost_timer = self.scheduler.schedule(duration, self._end_speed_boost)
+
+    def cancel_timers(self):
+        """Drop pending speed boost and fire timers."""
+        for timer in (self.speed_boost_timer, self.fire_timer):
+            if timer is not None:
+                timer.cancel()
+        self.speed_boost_timer = None
+        self.fire_timer = None
+
+    def _end_speed_boost(self):
+        self.speed_boost_timer = None
+
+
+class World:
+    """Display-free simulation of a round: pilots, horde, bullets and powerups.
+
+    Game drives it with a single pilot fed from the keyboard and mouse, the
+    multiplayer server with one pilot per connected client.
+
+    Args:
+        iso_map (IsoMap | None): Map whose projection gameplay distances use.
+        max_zombies (int): Cap on the size of the horde.
+        rng: Random source for spawns, the random module by default.
+    """
+
+    def __init__(self, iso_map=None, max_zombies=MAX_ZOMBIES, rng=random):
+        """Create a round with no pilots and the spawn timers running."""
+        self.map = iso_map or IsoMap(MAP_WIDTH, MAP_HEIGHT, TILE_WIDTH, TILE_HEIGHT, origin=(0, 0))
+        self.max_zombies = max_zombies
+        self.rng = rng
+        self.scheduler = Scheduler()
+        self.pilots = []
+        self.zombies = []
+        self.bullets = []
+        self.powerups = []
+        self.zombies_spawned = 0
+        self.spawn_timer = None
+        self.powerup_timer = None
+        self.restore_timers()
+
+    def add_pilot(self):
+        """Add a player to the round and return its Pilot."""
+        pilot = Pilot(self.scheduler)
+        self.pilots.append(pilot)
+        return pilot
+
+    def remove_pilot(self, pilot):
+        self.pilots.remove(pilot)
+        pilot.cancel_timers()
+
+    def dead_pilots(self):
+        return [pilot for pilot in self.pilots if pilot.player.hp <= 0]
+
+    def restore_timers(
+        self, zombie_delay=ZOMBIE_SPAWN_INTERVAL, powerup_delay=POWERUP_SPAWN_INTERVAL
+    ):
+        """(Re)start the zombie and powerup spawn timers with the given delays."""
+        for timer in (self.spawn_timer, self.powerup_timer):
+            if timer is not None:
+                timer.cancel()
+        self.spawn_timer = self.scheduler.schedule(zombie_delay, self._spawn_zombie_when_room)
+        self.powerup_timer = self.scheduler.schedule(powerup_delay, self._spawn_powerup_when_room)
+
+    def step(self, dt):
+        """Advance the simulation by dt seconds using each pilot's held input."""
+        for pilot in self.pilots:
+            self._update_pilot(pilot, dt)
+
+        self.scheduler.advance(dt)
+        if self.spawn_timer is None:
+            self._spawn_zombie_when_room()
+        if self.powerup_timer is None:
+            self._spawn_powerup_when_room()
+
+        if self.pilots:
+            for zombie in self.zombies:
+                zombie.update(self._chase_target(zombie), dt)
+        self._handle_player_hits()
+
+        for bullet in list(self.bullets):
+            bullet.update(dt)
+            if not bullet.alive:
+                self.bullets.remove(bullet)
+
+        self._handle_collisions()
+        self._handle_powerups()
+
+    def spawn_zombie(self):
+        """Spawn a zombie at random edge of the map"""
+        side = self.rng.choice(["top", "bottom", "left", "right"])
+        if side == "top":
+            pos = (self.rng.uniform(0, MAP_WIDTH - 1), 0)
+        elif side == "bottom":
+            pos = (self.rng.uniform(0, MAP_WIDTH - 1), MAP_HEIGHT - 1)
+        elif side == "left":
+            pos = (0, self.rng.uniform(0, MAP_HEIGHT - 1))
+        else:
+            pos = (MAP_WIDTH - 1, self.rng.uniform(0, MAP_HEIGHT - 1))
+        self.zombies_spawned += 1
+        speed = ZOMBIE_SPEED * (1 + (self.zombies_spawned - 1) * ZOMBIE_SPEED_GROWTH)
+        self.zombies.append(Zombie(pos, speed))
+
+    def _chase_target(self, zombie):
+        """World position a zombie walks toward."""
+        return self.pilots[0].player.pos
+
+    def _update_pilot(self, pilot, dt):
+        """Move and aim one player and start or stop its fire timer."""
+        pilot.player.update(pilot.keys, dt, (MAP_WIDTH, MAP_HEIGHT), pilot.speed_multiplier)
+        pilot.player.set_aim(pilot.aim)
+
+        if pilot.firing:
+            if pilot.fire_timer is None:
+                pilot.fire_timer = self.scheduler.schedule(
+                    FIRE_HOLD_DELAY + pilot.fire_cooldown(), lambda: self._fire(pilot)
+                )
+        elif pilot.fire_timer is not None:
+            pilot.fire_timer.cancel()
+            pilot.fire_timer = None
+
+    def _fire(self, pilot):
+        """Shoot in the aim direction and schedule the next shot."""
+        direction = pilot.player.aim_dir
+        if direction.length_squared() > 0:
+            speed = BULLET_SPEED + pilot.bullet_speed_bonus
+            self.bullets.append(Bullet(pilot.player.pos, direction, speed, owner=pilot))
+        pilot.fire_timer = self.scheduler.schedule(pilot.fire_cooldown(), lambda: self._fire(pilot))
+
+    def _spawn_zombie_when_room(self):
+        """Spawn a zombie if the horde has room and start the next interval.
+
+        While the horde is full the timer stays unset and step() retries
+        every tick, so a zombie appears on the first tick there is room.
+        """
+        self.spawn_timer = None
+        if len(self.zombies) < self.max_zombies:
+            self.spawn_zombie()
+            self.spawn_timer = self.scheduler.schedule(
+                ZOMBIE_SPAWN_INTERVAL, self._spawn_zombie_when_room
+            )
+
+    def _spawn_powerup_when_room(self):
+        """Powerup counterpart of _spawn_zombie_when_room."""
+        self.powerup_timer = None
+        if len(self.powerups) < MAX_POWERUPS:
+            self._spawn_powerup()
+            self.powerup_timer = self.scheduler.schedule(
+                POWERUP_SPAWN_INTERVAL, self._spawn_powerup_when_room
+            )
+
+    def _spawn_powerup(self):
+        kind = self.rng.choice(["heal", "speed"])
+        pos = (self.rng.uniform(1, MAP_WIDTH - 2), self.rng.uniform(1, MAP_HEIGHT - 2))
+        self.powerups.append(PowerUp(pos, kind))
+
+    def _handle_player_hits(self):
+        """Apply damage when a zombie touches a player."""
+        zombie_screens = [self.map.world_to_iso(zombie.pos) for zombie in self.zombies]
+        for pilot in self.pilots:
+            player = pilot.player
+            player_screen = self.map.world_to_iso(player.pos)
+            for zombie, zombie_screen in zip(self.zombies, zombie_screens):
+                if zombie_screen.distance_to(player_screen) < zombie.radius + player.radius:
+                    player.take_damage(ZOMBIE_DAMAGE)
+                    break
+
+    def _handle_collisions(self):
+        if not self.bullets:
+            return
+        zombie_screens = {zombie: self.map.world_to_iso(zombie.pos) for zombie in self.zombies}
+        for bullet in list(self.bullets):
+            bullet_screen = self.map.world_to_iso(bullet.pos)
+            for zombie in self.zombies:
+                zombie_screen = zombie_screens[zombie]
+                if bullet_screen.distance_to(zombie_screen) < bullet.radius + zombie.radius:
+                    self.bullets.remove(bullet)
+                    self.zombies.remove(zombie)
+                    if bullet.owner is not None:
+                        bullet.owner.add_kill()
+                    break
+
+    def _handle_powerups(self):
+        for pilot in self.pilots:
+            player = pilot.player
+            player_screen = self.map.world_to_iso(player.pos)
+            for powerup in list(self.powerups):
+                powerup_screen = self.map.world_to_iso(powerup.pos)
+                if powerup_screen.distance_to(player_screen) < powerup.radius + player.radius:
+                    if powerup.kind == "heal":
+                        player.hp = min(player.max_hp, player.hp + POWERUP_HEAL_AMOUNT)
+                    else:
+                        pilot.start_speed_boost(POWERUP_SPEED_DURATION)
+                    self.powerups.remove(powerup)